@@ -34,6 +34,7 @@ from collections import Counter, deque
 from copy import copy, deepcopy
 from dataclasses import asdict, astuple, dataclass, field, is_dataclass
 from enum import Enum
+from functools import cached_property
 from inspect import isclass
 from math import ceil
 from typing import (
@@ -163,28 +164,13 @@ class _MetaPayload(ABCMeta):
     The purpose of this metaclass is to remember the association
     between the type of payload and the payload class to build it.
     This is necessary to recover the right payload class to instantiate
-    at decoding time.
+    at decoding time. The association is recorded by
+    `BaseTxPayload.__init_subclass__`, so that only payload classes are
+    registered and no extra work happens on the metaclass' class creation path.
     """
 
     registry: Dict[str, Type["BaseTxPayload"]] = {}
 
-    def __new__(mcs, name: str, bases: Tuple, namespace: Dict, **kwargs: Any) -> Type:  # type: ignore
-        """Create a new class object."""
-        new_cls = super().__new__(mcs, name, bases, namespace, **kwargs)
-
-        if new_cls.__module__ == mcs.__module__ and new_cls.__name__ == "BaseTxPayload":
-            return new_cls
-        if not issubclass(new_cls, BaseTxPayload):
-            raise ValueError(  # pragma: no cover
-                f"class {name} must inherit from {BaseTxPayload.__name__}"
-            )
-        new_cls = cast(Type[BaseTxPayload], new_cls)
-        # remember association from transaction type to payload class
-        _metaclass_registry_key = f"{new_cls.__module__}.{new_cls.__name__}"  # type: ignore
-        mcs.registry[_metaclass_registry_key] = new_cls
-
-        return new_cls
-
 
 @dataclass(frozen=True)
 class BaseTxPayload(metaclass=_MetaPayload):
@@ -194,13 +180,21 @@ class BaseTxPayload(metaclass=_MetaPayload):
     round_count: int = field(default=ROUND_COUNT_DEFAULT, init=False)
     id_: str = field(default_factory=lambda: uuid.uuid4().hex, init=False)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Remember the association from the payload type to the payload class."""
+        super().__init_subclass__(**kwargs)
+        _metaclass_registry_key = f"{cls.__module__}.{cls.__name__}"
+        _MetaPayload.registry[_metaclass_registry_key] = cls
+
     @property
     def data(self) -> Dict[str, Any]:
         """Data"""
         excluded = ["sender", "round_count", "id_"]
         return {k: v for k, v in asdict(self).items() if k not in excluded}
 
-    @property
+    # the payload is frozen, so `values` is computed once per instance;
+    # rounds access it for every payload in their collection on each new payload
+    @cached_property
     def values(self) -> Tuple[Any, ...]:
         """Data"""
         excluded = 3  # refers to ["sender", "round_count", "id_"]
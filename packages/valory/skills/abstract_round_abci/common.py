@@ -185,7 +185,7 @@ class SelectKeeperBehaviour(BaseBehaviour, ABC):
             )
 
         # Sorted list of participants who are not blacklisted as keepers
-        relevant_set = sorted(list(non_blacklisted))
+        relevant_set = sorted(non_blacklisted)
 
         # Random seeding and shuffling of the set
         random.seed(self.synchronized_data.keeper_randomness)
@@ -20,7 +20,6 @@
 """Tests for valory/abstract_round_abci skill's behaviours."""
 import json
 from abc import ABC
-from copy import copy
 from enum import Enum
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -85,10 +84,10 @@ class FSMBehaviourBaseCase(BaseSkillTestCase, ABC):
             raise ValueError(f"No `path_to_skill` set on {cls}")  # pragma: nocover
             # works once https://github.com/valory-xyz/open-aea/issues/492 is fixed
         # we need to store the current value of the meta-class attribute
-        # _MetaPayload.transaction_type_to_payload_cls, and restore it
-        # in the teardown function. We do a shallow copy so we avoid
-        # to modify the old mapping during the execution of the tests.
-        cls.old_tx_type_to_payload_cls = copy(_MetaPayload.registry)
+        # _MetaPayload.registry, and restore it in the teardown function.
+        # The attribute is rebound to a new mapping rather than cleared,
+        # so keeping a reference is enough to leave the old one untouched.
+        cls.old_tx_type_to_payload_cls = _MetaPayload.registry
         _MetaPayload.registry = {}
         super().setup_class(**kwargs)  # pylint: disable=no-value-for-parameter
         assert (
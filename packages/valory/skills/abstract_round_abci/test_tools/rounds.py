@@ -23,6 +23,7 @@ import re
 from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -58,8 +59,10 @@ from packages.valory.skills.abstract_round_abci.base import (
 
 
 MAX_PARTICIPANTS: int = 4
+WRONG_ROUND_COUNT_MSG = re.escape("Expected round count -1 and got 0.")
 
 
+@lru_cache(maxsize=None)
 def get_participants() -> FrozenSet[str]:
     """Participants"""
     return frozenset([f"agent_{i}" for i in range(MAX_PARTICIPANTS)])
@@ -611,12 +614,12 @@ class _BaseRoundTestClass(BaseRoundTestClass):  # pylint: disable=too-few-public
         object.__setattr__(payload_with_wrong_round_count, "round_count", 0)
         with pytest.raises(
             TransactionNotValidError,
-            match=re.escape("Expected round count -1 and got 0."),
+            match=WRONG_ROUND_COUNT_MSG,
         ):
             test_round.check_payload(payload=payload_with_wrong_round_count)
 
         with pytest.raises(
             ABCIAppInternalError,
-            match=re.escape("Expected round count -1 and got 0."),
+            match=WRONG_ROUND_COUNT_MSG,
         ):
             test_round.process_payload(payload=payload_with_wrong_round_count)
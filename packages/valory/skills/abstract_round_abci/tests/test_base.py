@@ -333,6 +333,15 @@ class TestTransactions:
         lookalike = ObjectImitator(payload)
         assert not payload == lookalike
 
+    def test_payload_data_not_shared(self) -> None:
+        """Test that mutating the payload data does not affect its later readers."""
+        payload = DummyPayload(sender="sender", dummy_attribute=1)
+        payload.data["dummy_attribute"] = 2
+        payload.data.pop("dummy_attribute")
+        assert payload.data == {"dummy_attribute": 1}
+        assert payload.values == (1,)
+        assert payload.with_new_id().data == payload.data
+
     def test_transaction_not_equal_lookalike(self) -> None:
         """Test transaction __eq__ reflection via NotImplemented"""
         payload = PayloadA(sender="sender")
@@ -52,6 +52,13 @@ from packages.valory.skills.abstract_round_abci.test_tools.rounds import (
 )
 
 
+# escaped once, as the messages are matched in several tests
+SENDER_NOT_IN_PARTICIPANTS = re.escape(
+    "sender not in list of participants: ['agent_0', 'agent_1', 'agent_2', 'agent_3']"
+)
+INTERNAL_SENDER_NOT_IN_PARTICIPANTS = "internal error: " + SENDER_NOT_IN_PARTICIPANTS
+
+
 class TestCollectionRound(_BaseRoundTestClass):
     """Test class for CollectionRound."""
 
@@ -118,9 +125,7 @@ class TestCollectionRound(_BaseRoundTestClass):
 
         with pytest.raises(
             ABCIAppInternalError,
-            match=re.escape(
-                "internal error: sender not in list of participants: ['agent_0', 'agent_1', 'agent_2', 'agent_3']"
-            ),
+            match=INTERNAL_SENDER_NOT_IN_PARTICIPANTS,
         ):
             self.test_round.process_payload(DummyTxPayload("sender", "value"))
 
@@ -132,9 +137,7 @@ class TestCollectionRound(_BaseRoundTestClass):
 
         with pytest.raises(
             TransactionNotValidError,
-            match=re.escape(
-                "sender not in list of participants: ['agent_0', 'agent_1', 'agent_2', 'agent_3']"
-            ),
+            match=SENDER_NOT_IN_PARTICIPANTS,
         ):
             self.test_round.check_payload(DummyTxPayload("sender", "value"))
 
@@ -382,9 +385,7 @@ class TestOnlyKeeperSendsRound(_BaseRoundTestClass, BaseOnlyKeeperSendsRoundTest
 
         with pytest.raises(
             ABCIAppInternalError,
-            match=re.escape(
-                "internal error: sender not in list of participants: ['agent_0', 'agent_1', 'agent_2', 'agent_3']"
-            ),
+            match=INTERNAL_SENDER_NOT_IN_PARTICIPANTS,
         ):
             test_round.process_payload(DummyTxPayload(sender="sender", value="sender"))
 
@@ -400,9 +401,7 @@ class TestOnlyKeeperSendsRound(_BaseRoundTestClass, BaseOnlyKeeperSendsRoundTest
 
         with pytest.raises(
             TransactionNotValidError,
-            match=re.escape(
-                "sender not in list of participants: ['agent_0', 'agent_1', 'agent_2', 'agent_3']"
-            ),
+            match=SENDER_NOT_IN_PARTICIPANTS,
         ):
             test_round.check_payload(DummyTxPayload(sender="sender", value="sender"))
 
@@ -49,8 +49,8 @@ class FSMBehaviourTestToolSetup:
             raise AttributeError(f"{cls} must set `test_cls`")
 
         cls.__test_cls = cls.test_cls
-        cls.__old_value = _MetaPayload.registry.copy()
-        _MetaPayload.registry.clear()
+        cls.__old_value = _MetaPayload.registry
+        _MetaPayload.registry = {}
 
     @classmethod
     def teardown_class(cls) -> None:
@@ -19,24 +19,30 @@
 
 """Tests for abstract_round_abci/test_tools/base.py"""
 
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, cast
+from typing import Any, Dict, Generator, Type, cast
 
 import pytest
-from aea.mail.base import Envelope
+from aea.helpers.base import cd
+from aea.protocols.base import Message
+from aea.test_tools.utils import copy_class
 
 from packages.valory.connections.ledger.connection import (
     PUBLIC_ID as LEDGER_CONNECTION_PUBLIC_ID,
 )
 from packages.valory.protocols.contract_api.message import ContractApiMessage
 from packages.valory.protocols.ledger_api.message import LedgerApiMessage
-from packages.valory.skills.abstract_round_abci.base import AbciAppDB
+from packages.valory.skills.abstract_round_abci.base import AbciAppDB, _MetaPayload
 from packages.valory.skills.abstract_round_abci.behaviours import BaseBehaviour
 from packages.valory.skills.abstract_round_abci.test_tools.base import (
     DummyContext,
     FSMBehaviourBaseCase,
 )
-from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci import PUBLIC_ID
+from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci import (
+    PATH_TO_SKILL,
+    PUBLIC_ID,
+)
 from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci.behaviours import (
     DummyRoundBehaviour,
 )
@@ -47,43 +53,166 @@ from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci.rounds imp
     Event,
     SynchronizedData,
 )
-from packages.valory.skills.abstract_round_abci.tests.test_tools.base import (
-    FSMBehaviourTestToolSetup,
-)
 
 
-class TestFSMBehaviourBaseCaseSetup(FSMBehaviourTestToolSetup):
-    """test TestFSMBehaviourBaseCaseSetup setup"""
+# pylint: disable=redefined-outer-name,no-self-use
+
+
+LEDGER_REQUEST_KWARGS = dict(performative=LedgerApiMessage.Performative.GET_BALANCE)
+LEDGER_RESPONSE_KWARGS = dict(performative=LedgerApiMessage.Performative.BALANCE)
+CONTRACT_ID = "dummy_contract"
+CONTRACT_REQUEST_KWARGS = dict(performative=ContractApiMessage.Performative.GET_STATE)
+CONTRACT_RESPONSE_KWARGS = dict(performative=ContractApiMessage.Performative.STATE)
+# pytest's assertion rewriting may append an explanation, hence matched as a prefix
+EMPTY_OUTBOX_MSG = "Invalid number of messages in outbox. Expected 1. Found 0."
+# sorted, as the behaviours are a set and the tests should be collected in a stable order
+BEHAVIOURS = sorted(DummyRoundBehaviour.behaviours, key=lambda b: b.behaviour_id)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def isolated_payload_registry() -> Generator[None, None, None]:
+    """
+    Restore the payload registry once the module's tests are done.
+
+    The dummy skill is loaded into module-scoped fixtures which register its payloads.
+    Restoring the registry, even if a setup fails halfway, keeps the module
+    self-contained, whichever tests run before or after it.
+
+    :yield: None
+    """
+    registry = _MetaPayload.registry
+    yield
+    _MetaPayload.registry = registry
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skill_cwd() -> Generator[None, None, None]:
+    """Run the module's tests from the dummy skill's directory, which all of them load."""
+    with cd(PATH_TO_SKILL):
+        yield
+
+
+@contextmanager
+def _load_skill_cls(
+    **kwargs: Any,
+) -> Generator[Type[FSMBehaviourBaseCase], None, None]:
+    """Copy `FSMBehaviourBaseCase`, load the dummy skill on it and tear it down afterwards."""
+    test_cls = cast(Type[FSMBehaviourBaseCase], copy_class(FSMBehaviourBaseCase))
+    test_cls.path_to_skill = PATH_TO_SKILL
+    try:
+        test_cls.setup_class(**kwargs)
+        yield test_cls
+    finally:
+        test_cls.teardown_class()
+
+
+@pytest.fixture(scope="module")
+def loaded_skill_cls() -> Generator[Type[FSMBehaviourBaseCase], None, None]:
+    """Test class with the dummy skill loaded once for the whole module."""
+    with _load_skill_cls() as test_cls:
+        yield test_cls
+
+
+@pytest.fixture
+def configured_instance(
+    kwargs: Dict[str, Any],
+) -> Generator[FSMBehaviourBaseCase, None, None]:
+    """A set up instance of a test class with the dummy skill loaded using the parametrized `kwargs`."""
+    with _load_skill_cls(**kwargs) as test_cls:
+        test_instance = test_cls()
+        test_instance.setup()
+        yield test_instance
+        test_instance.teardown()
+
+
+@pytest.fixture
+def prepared_instance(
+    loaded_skill_cls: Type[FSMBehaviourBaseCase],
+) -> Generator[FSMBehaviourBaseCase, None, None]:
+    """A set up instance of the loaded test class."""
+    test_instance = loaded_skill_cls()
+    test_instance.setup()
+    yield test_instance
+    test_instance.teardown()
+
 
-    test_cls = FSMBehaviourBaseCase
+@pytest.fixture(scope="module")
+def synchronized_data() -> SynchronizedData:
+    """Synchronized data to fast forward to; only read by the FSM, hence shared."""
+    return SynchronizedData(AbciAppDB(setup_data=dict(participants=[tuple("abcd")])))
+
+
+class _FakeEnvelope:  # pylint: disable=too-few-public-methods
+    """A stand-in for an `Envelope`, of which the mocked requests only read the message."""
+
+    __slots__ = ("message", "protocol_specification_id", "to", "sender")
+
+    def __init__(self, message: Message) -> None:
+        """Wrap the message, addressed from the skill to the ledger connection."""
+        message.to = str(LEDGER_CONNECTION_PUBLIC_ID)
+        message.sender = str(PUBLIC_ID)
+        self.message = message
+        self.protocol_specification_id = message.protocol_specification_id
+        self.to = message.to
+        self.sender = message.sender
+
+
+@pytest.fixture(scope="session")
+def ledger_api_envelope() -> _FakeEnvelope:
+    """An envelope carrying the mocked ledger api request."""
+    message = LedgerApiMessage(**LEDGER_REQUEST_KWARGS, dialogue_reference=("a", "b"))  # type: ignore
+    return _FakeEnvelope(message)
+
+
+@pytest.fixture(scope="session")
+def contract_api_envelope() -> _FakeEnvelope:
+    """An envelope carrying the mocked contract api request."""
+    message = ContractApiMessage(
+        **CONTRACT_REQUEST_KWARGS,  # type: ignore
+        dialogue_reference=("a", "b"),
+        ledger_id="ethereum",
+        contract_id=CONTRACT_ID,
+    )
+    return _FakeEnvelope(message)
+
+
+class TestFSMBehaviourBaseCaseSetup:
+    """test TestFSMBehaviourBaseCaseSetup setup"""
 
     @pytest.mark.parametrize("kwargs", [{}])
     def test_setup_fails_without_path(self, kwargs: Dict[str, Dict[str, Any]]) -> None:
         """Test setup"""
+        test_cls = cast(Type[FSMBehaviourBaseCase], copy_class(FSMBehaviourBaseCase))
         with pytest.raises(ValueError):
-            self.test_cls.setup_class(**kwargs)
+            test_cls.setup_class(**kwargs)
 
     @pytest.mark.parametrize("kwargs", [{}, {"param_overrides": {"new_p": None}}])
-    def test_setup(self, kwargs: Dict[str, Dict[str, Any]]) -> None:
+    def test_setup(
+        self,
+        kwargs: Dict[str, Dict[str, Any]],
+        configured_instance: FSMBehaviourBaseCase,
+    ) -> None:
         """Test setup"""
 
-        self.set_path_to_skill()
-        test_instance = self.setup_test_cls(**kwargs)
+        test_instance = configured_instance
         assert test_instance
         assert hasattr(test_instance.behaviour.context.params, "new_p") == bool(kwargs)
 
-    @pytest.mark.parametrize("behaviour", DummyRoundBehaviour.behaviours)
-    def test_fast_forward_to_behaviour(self, behaviour: BaseBehaviour) -> None:
+    @pytest.mark.parametrize(
+        "behaviour", BEHAVIOURS, ids=[b.behaviour_id for b in BEHAVIOURS]
+    )
+    def test_fast_forward_to_behaviour(
+        self,
+        behaviour: BaseBehaviour,
+        prepared_instance: FSMBehaviourBaseCase,
+        synchronized_data: SynchronizedData,
+    ) -> None:
         """Test fast_forward_to_behaviour"""
-        self.set_path_to_skill()
-        test_instance = self.setup_test_cls()
+        test_instance = prepared_instance
 
         skill = test_instance._skill  # pylint: disable=protected-access
         round_behaviour = skill.skill_context.behaviours.main
         behaviour_id = behaviour.behaviour_id
-        synchronized_data = SynchronizedData(
-            AbciAppDB(setup_data=dict(participants=[tuple("abcd")]))
-        )
 
         test_instance.fast_forward_to_behaviour(
             behaviour=round_behaviour,
@@ -106,11 +235,12 @@ class TestFSMBehaviourBaseCaseSetup(FSMBehaviourTestToolSetup):
 
     @pytest.mark.parametrize("event", Event)
     @pytest.mark.parametrize("set_none", [False, True])
-    def test_end_round(self, event: Enum, set_none: bool) -> None:
+    def test_end_round(
+        self, event: Enum, set_none: bool, prepared_instance: FSMBehaviourBaseCase
+    ) -> None:
         """Test end_round"""
 
-        self.set_path_to_skill()
-        test_instance = self.setup_test_cls()
+        test_instance = prepared_instance
         current_behaviour = cast(
             BaseBehaviour, test_instance.behaviour.current_behaviour
         )
@@ -121,64 +251,46 @@ class TestFSMBehaviourBaseCaseSetup(FSMBehaviourTestToolSetup):
         test_instance.end_round(event)
         assert abci_app.current_round_height == 1 - int(set_none)
 
-    def test_mock_ledger_api_request(self) -> None:
+    def test_mock_ledger_api_request(
+        self,
+        prepared_instance: FSMBehaviourBaseCase,
+        ledger_api_envelope: _FakeEnvelope,
+    ) -> None:
         """Test mock_ledger_api_request"""
 
-        self.set_path_to_skill()
-        test_instance = self.setup_test_cls()
-
-        request_kwargs = dict(performative=LedgerApiMessage.Performative.GET_BALANCE)
-        response_kwargs = dict(performative=LedgerApiMessage.Performative.BALANCE)
-        with pytest.raises(
-            AssertionError,
-            match="Invalid number of messages in outbox. Expected 1. Found 0.",
-        ):
-            test_instance.mock_ledger_api_request(request_kwargs, response_kwargs)
-
-        message = LedgerApiMessage(**request_kwargs, dialogue_reference=("a", "b"))  # type: ignore
-        envelope = Envelope(
-            to=str(LEDGER_CONNECTION_PUBLIC_ID),
-            sender=str(PUBLIC_ID),
-            protocol_specification_id=LedgerApiMessage.protocol_specification_id,
-            message=message,
-        )
+        test_instance = prepared_instance
+
+        with pytest.raises(AssertionError) as exc_info:
+            test_instance.mock_ledger_api_request(
+                LEDGER_REQUEST_KWARGS, LEDGER_RESPONSE_KWARGS
+            )
+        assert str(exc_info.value).startswith(EMPTY_OUTBOX_MSG)
+
         multiplexer = test_instance._multiplexer  # pylint: disable=protected-access
-        multiplexer.out_queue.put_nowait(envelope)
-        test_instance.mock_ledger_api_request(request_kwargs, response_kwargs)
+        multiplexer.out_queue.put_nowait(ledger_api_envelope)
+        test_instance.mock_ledger_api_request(
+            LEDGER_REQUEST_KWARGS, LEDGER_RESPONSE_KWARGS
+        )
 
-    def test_mock_contract_api_request(self) -> None:
+    def test_mock_contract_api_request(
+        self,
+        prepared_instance: FSMBehaviourBaseCase,
+        contract_api_envelope: _FakeEnvelope,
+    ) -> None:
         """Test mock_contract_api_request"""
 
-        self.set_path_to_skill()
-        test_instance = self.setup_test_cls()
+        test_instance = prepared_instance
 
-        contract_id = "dummy_contract"
-        request_kwargs = dict(performative=ContractApiMessage.Performative.GET_STATE)
-        response_kwargs = dict(performative=ContractApiMessage.Performative.STATE)
-        with pytest.raises(
-            AssertionError,
-            match="Invalid number of messages in outbox. Expected 1. Found 0.",
-        ):
+        with pytest.raises(AssertionError) as exc_info:
             test_instance.mock_contract_api_request(
-                contract_id, request_kwargs, response_kwargs
+                CONTRACT_ID, CONTRACT_REQUEST_KWARGS, CONTRACT_RESPONSE_KWARGS
             )
+        assert str(exc_info.value).startswith(EMPTY_OUTBOX_MSG)
 
-        message = ContractApiMessage(
-            **request_kwargs,  # type: ignore
-            dialogue_reference=("a", "b"),
-            ledger_id="ethereum",
-            contract_id=contract_id
-        )
-        envelope = Envelope(
-            to=str(LEDGER_CONNECTION_PUBLIC_ID),
-            sender=str(PUBLIC_ID),
-            protocol_specification_id=ContractApiMessage.protocol_specification_id,
-            message=message,
-        )
         multiplexer = test_instance._multiplexer  # pylint: disable=protected-access
-        multiplexer.out_queue.put_nowait(envelope)
+        multiplexer.out_queue.put_nowait(contract_api_envelope)
         test_instance.mock_contract_api_request(
-            contract_id, request_kwargs, response_kwargs
+            CONTRACT_ID, CONTRACT_REQUEST_KWARGS, CONTRACT_RESPONSE_KWARGS
         )
 
 
@@ -56,7 +56,7 @@ class OffendBehaviour(BaseBehaviour):
     @property
     def first_agent(self) -> str:
         """Short the agents' addresses and get the first address."""
-        return sorted(self.shared_state.synchronized_data.all_participants)[0]
+        return min(self.shared_state.synchronized_data.all_participants)
 
     @property
     def params(self) -> OffendParams:
@@ -46,7 +46,7 @@ def get_participant_to_period_count(
 ) -> Dict[str, ResetPausePayload]:
     """participant_to_selection"""
     return {
-        participant: ResetPausePayload(sender=participant, period_count=period_count)
+        participant: ResetPausePayload(participant, period_count)
         for participant in participants
     }
 
@@ -113,15 +113,16 @@ class TestSlashingCheckRound(BaseRoundTestClass):
             for participant in self.participants
         ]
 
+        not_participant_msg = f"{bad_participant} not in list of participants"
         with pytest.raises(
             TransactionNotValidError,
-            match=f"{bad_participant} not in list of participants",
+            match=not_participant_msg,
         ):
             test_round.check_payload(bad_participant_payload)
 
         with pytest.raises(
             ABCIAppInternalError,
-            match=f"{bad_participant} not in list of participants",
+            match=not_participant_msg,
         ):
             test_round.process_payload(bad_participant_payload)
 
@@ -129,14 +130,17 @@ class TestSlashingCheckRound(BaseRoundTestClass):
         test_round.process_payload(first_payload)
 
         # a duplicate (valid) payload will not go through
+        duplicate_msg = (
+            f"sender {first_payload.sender} has already sent value for round"
+        )
         with pytest.raises(
             TransactionNotValidError,
-            match=f"sender {first_payload.sender} has already sent value for round",
+            match=duplicate_msg,
         ):
             test_round.check_payload(first_payload)
 
         with pytest.raises(
             ABCIAppInternalError,
-            match=f"sender {first_payload.sender} has already sent value for round",
+            match=duplicate_msg,
         ):
             test_round.process_payload(first_payload)
@@ -41,7 +41,7 @@ class SelectKeeperPayload(BaseTxPayload):
 
 @dataclass(frozen=True)
 class CreateTxPayload(BaseTxPayload):
-    """Represent a transaction payload of type 'select_keeper'."""
+    """Represent a transaction payload of type 'create_tx'."""
 
     tx_pda: str
     tx_digest: str
@@ -49,7 +49,7 @@ class CreateTxPayload(BaseTxPayload):
 
 @dataclass(frozen=True)
 class ApproveTxPayload(BaseTxPayload):
-    """Represent a transaction payload of type 'select_keeper'."""
+    """Represent a transaction payload of type 'approve_tx'."""
 
     tx_pda: str
     tx_digest: str
@@ -57,7 +57,7 @@ class ApproveTxPayload(BaseTxPayload):
 
 @dataclass(frozen=True)
 class ExecuteTxPayload(BaseTxPayload):
-    """Represent a transaction payload of type 'select_keeper'."""
+    """Represent a transaction payload of type 'execute_tx'."""
 
     tx_pda: str
     tx_digest: str
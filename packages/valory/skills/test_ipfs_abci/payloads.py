@@ -24,14 +24,13 @@ from enum import Enum
 from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 
 
-class TransactionType(Enum):
+class TransactionType(str, Enum):
     """Enumeration of transaction types."""
 
     DUMMY = "dummy"
 
-    def __str__(self) -> str:
-        """Get the string value of the transaction type."""
-        return self.value
+    # members are strings, hence `str(member)` can return the value without a Python call
+    __str__ = str.__str__
 
 
 @dataclass(frozen=True)
@@ -24,6 +24,8 @@
 import hashlib
 import logging  # noqa: F401
 from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 from typing import (
     Any,
     Deque,
@@ -105,23 +107,25 @@ RANDOMNESS: str = "d1c29dce46f979f9748210d24bce4eae8be91272f5ca1a6aea2832d3dd676
 DUMMY_RANDOMNESS = hashlib.sha256("hash".encode() + str(0).encode()).hexdigest()
 
 
+@lru_cache(maxsize=None)
 def get_participants() -> FrozenSet[str]:
     """Participants"""
     return frozenset([f"agent_{i}" for i in range(MAX_PARTICIPANTS)])
 
 
+# payloads are frozen and the helpers return read-only mappings,
+# hence the collections are built once and shared across the tests
+@lru_cache(maxsize=None)
 def get_participant_to_randomness(
     participants: FrozenSet[str], round_id: int
-) -> Dict[str, RandomnessPayload]:
+) -> Mapping[str, RandomnessPayload]:
     """participant_to_randomness"""
-    return {
-        participant: RandomnessPayload(
-            sender=participant,
-            round_id=round_id,
-            randomness=RANDOMNESS,
-        )
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: RandomnessPayload(participant, round_id, RANDOMNESS)
+            for participant in participants
+        }
+    )
 
 
 def get_most_voted_randomness() -> str:
@@ -129,25 +133,31 @@ def get_most_voted_randomness() -> str:
     return RANDOMNESS
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_selection(
     participants: FrozenSet[str],
     keepers: str,
-) -> Dict[str, SelectKeeperPayload]:
+) -> Mapping[str, SelectKeeperPayload]:
     """participant_to_selection"""
-    return {
-        participant: SelectKeeperPayload(sender=participant, keepers=keepers)
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: SelectKeeperPayload(participant, keepers)
+            for participant in participants
+        }
+    )
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_period_count(
     participants: FrozenSet[str], period_count: int
-) -> Dict[str, ResetPayload]:
+) -> Mapping[str, ResetPayload]:
     """participant_to_selection"""
-    return {
-        participant: ResetPayload(sender=participant, period_count=period_count)
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: ResetPayload(participant, period_count)
+            for participant in participants
+        }
+    )
 
 
 def get_safe_contract_address() -> str:
@@ -155,14 +165,17 @@ def get_safe_contract_address() -> str:
     return "0x6f6ab56aca12"
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_votes(
     participants: FrozenSet[str], vote: Optional[bool] = True
-) -> Dict[str, ValidatePayload]:
+) -> Mapping[str, ValidatePayload]:
     """participant_to_votes"""
-    return {
-        participant: ValidatePayload(sender=participant, vote=vote)
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: ValidatePayload(participant, vote)
+            for participant in participants
+        }
+    )
 
 
 def get_participant_to_votes_serialized(
@@ -179,14 +192,17 @@ def get_most_voted_tx_hash() -> str:
     return "tx_hash"
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_signature(
     participants: FrozenSet[str],
-) -> Dict[str, SignaturePayload]:
+) -> Mapping[str, SignaturePayload]:
     """participant_to_signature"""
-    return {
-        participant: SignaturePayload(sender=participant, signature="signature")
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: SignaturePayload(participant, "signature")
+            for participant in participants
+        }
+    )
 
 
 def get_final_tx_hash() -> str:
@@ -194,31 +210,34 @@ def get_final_tx_hash() -> str:
     return "tx_hash"
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_check(
     participants: FrozenSet[str],
     status: str,
     tx_hash: str,
-) -> Dict[str, CheckTransactionHistoryPayload]:
+) -> Mapping[str, CheckTransactionHistoryPayload]:
     """Get participants to check"""
-    return {
-        participant: CheckTransactionHistoryPayload(
-            sender=participant,
-            verified_res=status + tx_hash,
-        )
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: CheckTransactionHistoryPayload(participant, status + tx_hash)
+            for participant in participants
+        }
+    )
 
 
+@lru_cache(maxsize=None)
 def get_participant_to_late_arriving_tx_hashes(
     participants: FrozenSet[str],
-) -> Dict[str, SynchronizeLateMessagesPayload]:
+) -> Mapping[str, SynchronizeLateMessagesPayload]:
     """participant_to_selection"""
-    return {
-        participant: SynchronizeLateMessagesPayload(
-            sender=participant, tx_hashes="1" * TX_HASH_LENGTH + "2" * TX_HASH_LENGTH
-        )
-        for participant in participants
-    }
+    return MappingProxyType(
+        {
+            participant: SynchronizeLateMessagesPayload(
+                participant, "1" * TX_HASH_LENGTH + "2" * TX_HASH_LENGTH
+            )
+            for participant in participants
+        }
+    )
 
 
 def get_late_arriving_tx_hashes_deserialized() -> Dict[str, List[str]]:
@@ -261,6 +280,7 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
 
         self.synchronized_data.update(tx_hashes_history="t" * 66)
 
+        serialized_votes = get_participant_to_votes_serialized(self.participants)
         test_round = self.test_class(
             synchronized_data=self.synchronized_data,
             context=MagicMock(),
@@ -271,9 +291,7 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
                 test_round=test_round,
                 round_payloads=get_participant_to_votes(self.participants),
                 synchronized_data_update_fn=lambda _synchronized_data, _: _synchronized_data.update(
-                    participant_to_votes=get_participant_to_votes_serialized(
-                        self.participants
-                    )
+                    participant_to_votes=serialized_votes
                 ),
                 synchronized_data_attr_checks=[
                     lambda _synchronized_data: _synchronized_data.participant_to_votes.keys()
@@ -287,6 +305,9 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
     ) -> None:
         """Test ValidateRound."""
 
+        serialized_votes = get_participant_to_votes_serialized(
+            self.participants, vote=False
+        )
         test_round = self.test_class(
             synchronized_data=self.synchronized_data,
             context=MagicMock(),
@@ -297,9 +318,7 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
                 test_round=test_round,
                 round_payloads=get_participant_to_votes(self.participants, vote=False),
                 synchronized_data_update_fn=lambda _synchronized_data, _: _synchronized_data.update(
-                    participant_to_votes=get_participant_to_votes_serialized(
-                        self.participants, vote=False
-                    )
+                    participant_to_votes=serialized_votes
                 ),
                 synchronized_data_attr_checks=[],
                 exit_event=self._event_class.NEGATIVE,
@@ -311,6 +330,9 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
     ) -> None:
         """Test ValidateRound."""
 
+        serialized_votes = get_participant_to_votes_serialized(
+            self.participants, vote=None
+        )
         test_round = self.test_class(
             synchronized_data=self.synchronized_data,
             context=MagicMock(),
@@ -321,9 +343,7 @@ class BaseValidateRoundTest(BaseVotingRoundTest):
                 test_round=test_round,
                 round_payloads=get_participant_to_votes(self.participants, vote=None),
                 synchronized_data_update_fn=lambda _synchronized_data, _: _synchronized_data.update(
-                    participant_to_votes=get_participant_to_votes_serialized(
-                        self.participants, vote=None
-                    )
+                    participant_to_votes=serialized_votes
                 ),
                 synchronized_data_attr_checks=[],
                 exit_event=self._event_class.NONE,
@@ -359,19 +379,17 @@ class BaseSelectKeeperRoundTest(BaseCollectSameUntilThresholdRoundTest):
             ),
             context=MagicMock(),
         )
+        round_payloads = self._participant_to_selection(
+            self.participants, most_voted_payload
+        )
+        serialized_selection = CollectionRound.serialize_collection(round_payloads)
 
         self._complete_run(
             self._test_round(
                 test_round=test_round,
-                round_payloads=self._participant_to_selection(
-                    self.participants, most_voted_payload
-                ),
+                round_payloads=round_payloads,
                 synchronized_data_update_fn=lambda _synchronized_data, _test_round: _synchronized_data.update(
-                    participant_to_selection=CollectionRound.serialize_collection(
-                        self._participant_to_selection(
-                            self.participants, most_voted_payload
-                        )
-                    )
+                    participant_to_selection=serialized_selection
                 ),
                 synchronized_data_attr_checks=[
                     lambda _synchronized_data: _synchronized_data.participant_to_selection.keys()
@@ -384,55 +402,36 @@ class BaseSelectKeeperRoundTest(BaseCollectSameUntilThresholdRoundTest):
         )
 
 
-class TestSelectKeeperTransactionSubmissionARound(BaseSelectKeeperRoundTest):
-    """Test SelectKeeperTransactionSubmissionARound"""
+class TestSelectKeeperTransactionSubmissionRounds(BaseSelectKeeperRoundTest):
+    """Test SelectKeeperTransactionSubmissionARound and SelectKeeperTransactionSubmissionBRound"""
 
-    test_class = SelectKeeperTransactionSubmissionARound
     test_payload = SelectKeeperPayload
     _synchronized_data_class = TransactionSettlementSynchronizedSata
     _event_class = TransactionSettlementEvent
 
     @pytest.mark.parametrize(
-        "most_voted_payload, keepers, exit_event",
+        "test_class, most_voted_payload, keepers, exit_event",
         (
             (
+                SelectKeeperTransactionSubmissionARound,
                 "incorrectly_serialized",
                 "",
                 TransactionSettlementEvent.INCORRECT_SERIALIZATION,
             ),
             (
+                SelectKeeperTransactionSubmissionARound,
                 int(1).to_bytes(32, "big").hex() + "new_keeper" + "-" * 32,
                 "",
                 TransactionSettlementEvent.DONE,
             ),
-        ),
-    )
-    def test_run(
-        self,
-        most_voted_payload: str,
-        keepers: str,
-        exit_event: TransactionSettlementEvent,
-    ) -> None:
-        """Run tests."""
-        super().test_run(most_voted_payload, keepers, exit_event)
-
-
-class TestSelectKeeperTransactionSubmissionBRound(
-    TestSelectKeeperTransactionSubmissionARound
-):
-    """Test SelectKeeperTransactionSubmissionBRound."""
-
-    test_class = SelectKeeperTransactionSubmissionBRound
-
-    @pytest.mark.parametrize(
-        "most_voted_payload, keepers, exit_event",
-        (
             (
+                SelectKeeperTransactionSubmissionBRound,
                 int(1).to_bytes(32, "big").hex() + "new_keeper" + "-" * 32,
                 "",
                 TransactionSettlementEvent.DONE,
             ),
             (
+                SelectKeeperTransactionSubmissionBRound,
                 int(1).to_bytes(32, "big").hex() + "new_keeper" + "-" * 32,
                 int(1).to_bytes(32, "big").hex()
                 + "".join(
@@ -441,23 +440,34 @@ class TestSelectKeeperTransactionSubmissionBRound(
                 TransactionSettlementEvent.DONE,
             ),
         ),
+        ids=[
+            "a_incorrect_serialization",
+            "a_done",
+            "b_done",
+            "b_done_with_previous_keepers",
+        ],
     )
     def test_run(
         self,
+        test_class: Type[CollectSameUntilThresholdRound],
         most_voted_payload: str,
         keepers: str,
         exit_event: TransactionSettlementEvent,
     ) -> None:
         """Run tests."""
+        self.test_class = test_class
         super().test_run(most_voted_payload, keepers, exit_event)
 
 
 class TestSelectKeeperTransactionSubmissionBAfterTimeoutRound(
-    TestSelectKeeperTransactionSubmissionBRound
+    BaseSelectKeeperRoundTest
 ):
     """Test SelectKeeperTransactionSubmissionBAfterTimeoutRound."""
 
     test_class = SelectKeeperTransactionSubmissionBAfterTimeoutRound
+    test_payload = SelectKeeperPayload
+    _synchronized_data_class = TransactionSettlementSynchronizedSata
+    _event_class = TransactionSettlementEvent
 
     @mock.patch.object(
         TransactionSettlementSynchronizedSata,
@@ -787,19 +797,17 @@ class TestCheckTransactionHistoryRound(BaseCollectSameUntilThresholdRoundTest):
             synchronized_data=self.synchronized_data,
             context=MagicMock(),
         )
+        round_payloads = get_participant_to_check(
+            self.participants, expected_status, expected_tx_hash
+        )
+        serialized_check = CollectionRound.serialize_collection(round_payloads)
 
         self._complete_run(
             self._test_round(
                 test_round=test_round,
-                round_payloads=get_participant_to_check(
-                    self.participants, expected_status, expected_tx_hash
-                ),
+                round_payloads=round_payloads,
                 synchronized_data_update_fn=lambda synchronized_data, _: synchronized_data.update(
-                    participant_to_check=CollectionRound.serialize_collection(
-                        get_participant_to_check(
-                            self.participants, expected_status, expected_tx_hash
-                        )
-                    ),
+                    participant_to_check=serialized_check,
                     final_verification_status=int(expected_status),
                     tx_hashes_history=[expected_tx_hash],
                     keepers=keepers,